@@ -38,6 +38,12 @@ class Settings(BaseSettings):
     conversation_history_ttl_hours: int = 24
     conversation_history_retention_days: int = 30  # 오래된 대화 이력 자동 삭제 (일 단위)
 
+    # Reminder polling (적응형 간격: 처리할 리마인더가 없으면 최대 간격까지 점차 늘린다)
+    reminder_poll_min_seconds: float = 5.0
+    reminder_poll_max_seconds: float = 30.0
+    reminder_poll_backoff_factor: float = 2.0
+    reminder_batch_size: int = 100  # 폴링 한 번에 조회·전송하는 최대 리마인더 수
+
     # Family invite
     invite_code_default_expiry_days: int = 7
 
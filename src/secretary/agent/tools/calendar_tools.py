@@ -10,7 +10,7 @@ from secretary.services.calendar_service import (
     create_event,
     delete_event,
     get_today_schedule,
-    list_events,
+    list_events_summary,
     update_event,
 )
 
@@ -64,7 +64,7 @@ def get_calendar_tools(user_id: int, family_group_id: int) -> list:
         if args.get("end"):
             end = datetime.fromisoformat(args["end"])
         async with async_session() as session:
-            events = await list_events(session, user_id, family_group_id, start, end)
+            events = await list_events_summary(session, user_id, family_group_id, start, end)
             if not events:
                 return _text("해당 기간에 일정이 없습니다.")
             lines = []
@@ -11,12 +11,14 @@ from secretary.models.user import FamilyGroup, User
 from secretary.services.user_service import (
     create_family_invite,
     deactivate_invite,
-    get_family_members,
+    get_family_members_by_group,
     list_family_invites,
     use_invite_code,
     validate_invite_code,
 )
 
+_INVALID_INVITE_MSG = "유효하지 않은 초대 코드입니다. 만료되었거나 사용 횟수를 초과했을 수 있어요."
+
 
 def _text(msg: str) -> dict[str, Any]:
     return {"content": [{"type": "text", "text": msg}]}
@@ -117,7 +119,7 @@ def get_family_tools(user_id: int) -> list:
                 return _text("사용자 정보를 찾을 수 없습니다.")
 
             # Check if user is the only member in their current group
-            members = await get_family_members(session, user_id)
+            members = await get_family_members_by_group(session, user.family_group_id)
             if len(members) > 1:
                 return _text(
                     "현재 가족 그룹에 다른 구성원이 있어서 이동할 수 없습니다. "
@@ -126,18 +128,21 @@ def get_family_tools(user_id: int) -> list:
 
             invite = await validate_invite_code(session, code)
             if not invite:
-                return _text("유효하지 않은 초대 코드입니다. 만료되었거나 사용 횟수를 초과했을 수 있어요.")
+                return _text(_INVALID_INVITE_MSG)
 
             if invite.family_group_id == user.family_group_id:
                 return _text("이미 해당 가족 그룹에 속해 있습니다.")
 
+            # 검증 이후 사용 횟수가 소진됐을 수 있으므로 사용 처리에 성공해야 이동한다
+            if not await use_invite_code(session, invite, commit=False):
+                return _text(_INVALID_INVITE_MSG)
+
             # Save old group for cleanup
             old_group_id = user.family_group_id
 
             # Move user to new family
             user.family_group_id = invite.family_group_id
             user.role = "member"
-            await use_invite_code(session, invite)
 
             # Delete empty old group
             old_members_result = await session.execute(
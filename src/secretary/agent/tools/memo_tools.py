@@ -8,7 +8,7 @@ from secretary.models.database import async_session
 from secretary.services.memo_service import (
     create_memo,
     delete_memo,
-    list_memos,
+    list_memos_summary,
     search_memos,
     update_memo,
 )
@@ -44,7 +44,7 @@ def get_memo_tools(user_id: int, family_group_id: int) -> list:
     )
     async def list_memos_tool(args: dict[str, Any]) -> dict[str, Any]:
         async with async_session() as session:
-            memos = await list_memos(session, user_id, family_group_id)
+            memos = await list_memos_summary(session, user_id, family_group_id)
             if not memos:
                 return _text("저장된 메모가 없습니다.")
             lines = []
@@ -8,6 +8,14 @@ from claude_agent_sdk import tool
 
 from config.settings import settings
 
+# script/style 블록과 HTML 주석 (내용까지 통째로 제거)
+_BLOCK_RE = re.compile(
+    r"<script[\s\S]*?</script>|<style[\s\S]*?</style>|<!--[\s\S]*?-->", re.IGNORECASE
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
 
 def _strip_html(html: str) -> str:
     """HTML에서 텍스트만 추출합니다.
@@ -16,13 +24,10 @@ def _strip_html(html: str) -> str:
     2. 나머지 HTML 태그 제거
     3. 연속 공백/줄바꿈 정리
     """
-    # script, style 태그와 내용 제거
-    text = re.sub(r"<script[\s\S]*?</script>", "", html, flags=re.IGNORECASE)
-    text = re.sub(r"<style[\s\S]*?</style>", "", text, flags=re.IGNORECASE)
-    # HTML 주석 제거
-    text = re.sub(r"<!--[\s\S]*?-->", "", text)
+    # script, style 태그와 내용, HTML 주석을 한 번의 스캔으로 제거
+    text = _BLOCK_RE.sub("", html)
     # 모든 HTML 태그 제거
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _TAG_RE.sub(" ", text)
     # HTML 엔티티 변환 (일반적인 것들)
     text = text.replace("&nbsp;", " ")
     text = text.replace("&amp;", "&")
@@ -31,8 +36,8 @@ def _strip_html(html: str) -> str:
     text = text.replace("&quot;", '"')
     text = text.replace("&#39;", "'")
     # 연속 공백을 하나로, 연속 줄바꿈을 최대 2개로 정리
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n\s*\n", "\n\n", text)
+    text = _SPACES_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
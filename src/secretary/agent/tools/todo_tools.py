@@ -9,7 +9,7 @@ from secretary.models.database import async_session
 from secretary.services.memo_service import (
     create_todo,
     delete_todo,
-    list_todos,
+    list_todos_summary,
     toggle_todo,
     update_todo,
 )
@@ -51,7 +51,7 @@ def get_todo_tools(user_id: int, family_group_id: int) -> list:
     )
     async def list_todos_tool(args: dict[str, Any]) -> dict[str, Any]:
         async with async_session() as session:
-            todos = await list_todos(
+            todos = await list_todos_summary(
                 session,
                 user_id,
                 family_group_id,
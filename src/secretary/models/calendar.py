@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Integer, String, Text, func
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from secretary.models.database import Base
@@ -8,6 +8,10 @@ from secretary.models.database import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # list_events: 작성자(본인/가족 구성원)별 start_time 범위 조회
+        Index("ix_events_user_start", "user_id", "start_time"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -22,6 +26,16 @@ class Event(Base):
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        # get_due_reminders: is_delivered = 0 AND remind_at <= now
+        # 미발송 리마인더만 담는 부분 인덱스라 발송 완료 이력이 쌓여도 작게 유지된다
+        Index(
+            "ix_reminders_active_time",
+            "remind_at",
+            sqlite_where=text("is_delivered = 0"),
+            postgresql_where=text("is_delivered = false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy import ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from secretary.models.database import Base
@@ -8,6 +8,10 @@ from secretary.models.database import Base
 
 class ConversationHistory(Base):
     __tablename__ = "conversation_history"
+    __table_args__ = (
+        # get_recent_conversations: user_id 필터 + created_at 역순 LIMIT (인덱스 역방향 스캔)
+        Index("ix_conversation_user_created", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Connection
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -14,9 +15,17 @@ class Base(DeclarativeBase):
 
 
 async def init_db() -> None:
-    """Create all tables."""
+    """Create all tables, plus any indexes missing from existing tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(conn: Connection) -> None:
+    # create_all은 이미 존재하는 테이블에 새로 추가된 인덱스를 만들지 않는다
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -21,7 +21,8 @@ class User(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     display_name: Mapped[str] = mapped_column(String(100))
-    family_group_id: Mapped[int] = mapped_column(ForeignKey("family_groups.id"))
+    # 가족 구성원 조회(get_family_members, 가족 공유 메모/일정 필터)용 인덱스
+    family_group_id: Mapped[int] = mapped_column(ForeignKey("family_groups.id"), index=True)
     role: Mapped[str] = mapped_column(String(20), default="member")  # admin | member
     timezone: Mapped[str] = mapped_column(String(50), default="Asia/Seoul")
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
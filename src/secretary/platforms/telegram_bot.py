@@ -28,6 +28,11 @@ TELEGRAM_MAX_LENGTH = 4096
 # 청크 사이 전송 딜레이 (초) — 순서 보장용
 CHUNK_SEND_DELAY = 0.3
 
+# 코드 블록 (```로 시작하고 ```로 끝나는 블록)
+_CODE_BLOCK_RE = re.compile(r"(```[^\n]*\n.*?```)", re.DOTALL)
+# 문단 구분자 (빈 줄), split 결과에 구분자를 포함하기 위해 그룹으로 감싼다
+_PARAGRAPH_SEP_RE = re.compile(r"(\n\n+)")
+
 
 def split_message(text: str, max_length: int = TELEGRAM_MAX_LENGTH) -> list[str]:
     """긴 텍스트를 텔레그램 메시지 제한에 맞게 분할한다.
@@ -43,32 +48,35 @@ def split_message(text: str, max_length: int = TELEGRAM_MAX_LENGTH) -> list[str]
     # 코드 블록을 인식하면서 문단 단위로 분리
     segments = _split_into_segments(text)
     chunks: list[str] = []
-    current = ""
+    # 현재 청크는 조각 목록과 누적 길이로 관리하고, 확정될 때 한 번만 join한다
+    current: list[str] = []
+    current_len = 0
 
     for segment in segments:
         # 현재 청크에 세그먼트를 추가해도 제한 이내인 경우
-        candidate = current + segment if current else segment
-        if len(candidate) <= max_length:
-            current = candidate
+        if current_len + len(segment) <= max_length:
+            current.append(segment)
+            current_len += len(segment)
             continue
 
         # 현재 청크가 비어있지 않으면 먼저 저장
-        if current:
-            chunks.append(current)
-            current = ""
+        if current_len:
+            chunks.append("".join(current))
 
         # 세그먼트 자체가 제한을 초과하면 줄 단위로 분할
         if len(segment) > max_length:
             sub_chunks = _split_segment_by_lines(segment, max_length)
             # 마지막 조각은 다음 세그먼트와 합칠 수 있으므로 current에 보관
-            for sc in sub_chunks[:-1]:
-                chunks.append(sc)
-            current = sub_chunks[-1] if sub_chunks else ""
+            chunks.extend(sub_chunks[:-1])
+            last = sub_chunks[-1] if sub_chunks else ""
+            current = [last]
+            current_len = len(last)
         else:
-            current = segment
+            current = [segment]
+            current_len = len(segment)
 
-    if current:
-        chunks.append(current)
+    if current_len:
+        chunks.append("".join(current))
 
     return chunks
 
@@ -79,9 +87,7 @@ def _split_into_segments(text: str) -> list[str]:
     코드 블록은 하나의 세그먼트로 유지하고, 일반 텍스트는 빈 줄 기준으로 문단 분리한다.
     각 세그먼트 뒤에 원래의 구분자(빈 줄)를 포함한다.
     """
-    # 코드 블록을 매칭 (```로 시작하고 ```로 끝나는 블록)
-    code_block_pattern = re.compile(r"(```[^\n]*\n.*?```)", re.DOTALL)
-    parts = code_block_pattern.split(text)
+    parts = _CODE_BLOCK_RE.split(text)
 
     segments: list[str] = []
     for part in parts:
@@ -92,7 +98,7 @@ def _split_into_segments(text: str) -> list[str]:
             segments.append(part)
         else:
             # 일반 텍스트: 빈 줄 기준으로 문단 분리 (구분자 포함)
-            paragraphs = re.split(r"(\n\n+)", part)
+            paragraphs = _PARAGRAPH_SEP_RE.split(part)
             segments.extend(p for p in paragraphs if p)
 
     return segments
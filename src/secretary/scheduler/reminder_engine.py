@@ -1,4 +1,4 @@
-"""APScheduler-based engine. 리마인더 폴링(30초)과 대화 이력 정리(매일) 잡을 관리한다."""
+"""APScheduler-based engine. 리마인더 폴링(적응형 간격)과 대화 이력 정리(매일) 잡을 관리한다."""
 
 import logging
 from datetime import datetime
@@ -6,10 +6,12 @@ from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import settings
+from secretary.models.calendar import Reminder
 from secretary.models.database import async_session
-from secretary.services.calendar_service import get_due_reminders, mark_delivered
+from secretary.services.calendar_service import get_due_reminders, mark_delivered_bulk
 from secretary.services.conversation_service import cleanup_old_conversations
 from secretary.services.notification_service import notification_service
 
@@ -19,12 +21,16 @@ logger = logging.getLogger(__name__)
 class ReminderEngine:
     def __init__(self) -> None:
         self._scheduler: AsyncIOScheduler | None = None
+        self._poll_interval = settings.reminder_poll_min_seconds
+        # 직전 폴링이 가득 찬 배치를 처리했으면 그 마지막 (remind_at, id), 아니면 None
+        self._cursor: tuple[datetime, int] | None = None
 
     async def start(self) -> None:
         self._scheduler = AsyncIOScheduler()
+        self._poll_interval = settings.reminder_poll_min_seconds
         self._scheduler.add_job(
-            self._check_reminders,
-            trigger=IntervalTrigger(seconds=30),
+            self._poll_reminders,
+            trigger=IntervalTrigger(seconds=self._poll_interval),
             id="reminder_check",
             replace_existing=True,
         )
@@ -36,7 +42,11 @@ class ReminderEngine:
             replace_existing=True,
         )
         self._scheduler.start()
-        logger.info("Reminder engine started (30s interval)")
+        logger.info(
+            "Reminder engine started (adaptive %.0f-%.0fs interval)",
+            settings.reminder_poll_min_seconds,
+            settings.reminder_poll_max_seconds,
+        )
         logger.info(
             "Conversation cleanup scheduled (daily 03:00, retention=%d days)",
             settings.conversation_history_retention_days,
@@ -46,68 +56,82 @@ class ReminderEngine:
         if self._scheduler:
             self._scheduler.shutdown(wait=False)
 
-    async def _check_reminders(self) -> None:
+    async def _poll_reminders(self) -> None:
+        """리마인더를 확인하고 결과에 따라 다음 폴링 간격을 조정한다.
+
+        실제로 전송한 리마인더가 있었거나 아직 남은 배치가 있으면 최소 간격으로 되돌리고,
+        없으면(전송 실패만 있었던 경우 포함) backoff_factor 배씩 늘려 최대 간격까지 늦춘다.
+        """
+        delivered = await self._check_reminders()
+        if delivered or self._cursor is not None:
+            interval = settings.reminder_poll_min_seconds
+        else:
+            interval = min(
+                self._poll_interval * settings.reminder_poll_backoff_factor,
+                settings.reminder_poll_max_seconds,
+            )
+        if interval != self._poll_interval and self._scheduler:
+            self._poll_interval = interval
+            self._scheduler.reschedule_job(
+                "reminder_check", trigger=IntervalTrigger(seconds=interval)
+            )
+
+    async def _check_reminders(self) -> int:
         """Check for due reminders and send notifications.
 
-        반복 리마인더의 경우 mark_delivered()가 다음 알림 시간을 재설정한다.
+        폴링마다 reminder_batch_size개까지만 조회·전송한다. 배치가 가득 차면 마지막
+        (remind_at, id)를 기억해 다음 폴링은 그 뒤부터 조회하고, 끝에 도달하면 처음부터
+        다시 훑는다. 전송에 계속 실패하는 오래된 리마인더가 쌓여도 더 최근 리마인더가
+        밀려나지 않는다.
+
+        Returns:
+            전송에 성공한 리마인더 수 (오류 시 0)
         """
+        batch_size = settings.reminder_batch_size
         try:
             async with async_session() as session:
-                reminders = await get_due_reminders(session, datetime.now())
-                for reminder in reminders:
-                    # 반복 리마인더인 경우 반복 정보 표시
-                    recur_label = ""
-                    if reminder.is_recurring and reminder.recurrence_rule:
-                        rule_labels = {
-                            "daily": "매일",
-                            "weekly": "매주",
-                            "monthly": "매월",
-                        }
-                        label = rule_labels.get(
-                            reminder.recurrence_rule.strip().lower(),
-                            reminder.recurrence_rule,
-                        )
-                        recur_label = f" (반복: {label})"
-
-                    text = f"⏰ 리마인더: {reminder.message}{recur_label}"
-                    sent = await notification_service.notify_user(session, reminder.user_id, text)
-                    if sent:
-                        await mark_delivered(session, reminder.id)
-                        if reminder.is_recurring and reminder.recurrence_rule:
-                            # 세션을 refresh하여 갱신된 remind_at 확인
-                            await session.refresh(reminder)
-                            if not reminder.is_delivered:
-                                logger.info(
-                                    "Recurring reminder #%d delivered to user_id=%d, "
-                                    "next at %s (rule=%s, delivered_count=%d)",
-                                    reminder.id,
-                                    reminder.user_id,
-                                    reminder.remind_at,
-                                    reminder.recurrence_rule,
-                                    reminder.delivered_count,
-                                )
-                            else:
-                                logger.info(
-                                    "Recurring reminder #%d final delivery to user_id=%d "
-                                    "(recurrence ended, delivered_count=%d)",
-                                    reminder.id,
-                                    reminder.user_id,
-                                    reminder.delivered_count,
-                                )
-                        else:
-                            logger.info(
-                                "Delivered reminder #%d to user_id=%d",
-                                reminder.id,
-                                reminder.user_id,
-                            )
-                    else:
-                        logger.warning(
-                            "Failed to deliver reminder #%d to user_id=%d",
-                            reminder.id,
-                            reminder.user_id,
-                        )
+                reminders = await get_due_reminders(
+                    session, datetime.now(), limit=batch_size, after=self._cursor
+                )
+                # 전송 후에는 반복 리마인더의 remind_at이 바뀌므로 먼저 커서를 정해 둔다
+                if len(reminders) == batch_size:
+                    last = reminders[-1]
+                    self._cursor = (last.remind_at, last.id)
+                else:
+                    self._cursor = None
+                return await self._deliver_batch(session, reminders)
         except Exception:
             logger.exception("Error in reminder check")
+            return 0
+
+    async def _deliver_batch(self, session: AsyncSession, reminders: list[Reminder]) -> int:
+        """리마인더를 전송하고, 전송에 성공한 것을 mark_delivered_bulk()로 발송 완료 처리한다.
+
+        반복 리마인더의 경우 다음 알림 시간이 재설정된다. 전송 도중 예외나 취소가
+        발생해도 이미 보낸 리마인더는 finally에서 기록하므로 다음 폴링에서 다시 보내지 않는다.
+
+        Returns:
+            전송에 성공한 리마인더 수
+        """
+        delivered: list[Reminder] = []
+        try:
+            for reminder in reminders:
+                text = f"⏰ 리마인더: {reminder.message}{_recurrence_label(reminder)}"
+                sent = await notification_service.notify_user(session, reminder.user_id, text)
+                if sent:
+                    delivered.append(reminder)
+                else:
+                    logger.warning(
+                        "Failed to deliver reminder #%d to user_id=%d",
+                        reminder.id,
+                        reminder.user_id,
+                    )
+        finally:
+            if delivered:
+                # 세션의 Reminder 객체에 갱신된 remind_at/is_delivered가 반영된다
+                await mark_delivered_bulk(session, [r.id for r in delivered])
+                _log_delivered(delivered)
+        return len(delivered)
 
     async def _cleanup_conversations(self) -> None:
         """보관 기간이 지난 오래된 대화 이력을 정리한다."""
@@ -122,4 +146,46 @@ class ReminderEngine:
             logger.exception("Error in conversation cleanup")
 
 
+def _recurrence_label(reminder: Reminder) -> str:
+    """반복 리마인더인 경우 알림 문구에 붙일 반복 정보를 반환한다."""
+    if not (reminder.is_recurring and reminder.recurrence_rule):
+        return ""
+    rule_labels = {
+        "daily": "매일",
+        "weekly": "매주",
+        "monthly": "매월",
+    }
+    label = rule_labels.get(reminder.recurrence_rule.strip().lower(), reminder.recurrence_rule)
+    return f" (반복: {label})"
+
+
+def _log_delivered(delivered: list[Reminder]) -> None:
+    for reminder in delivered:
+        if reminder.is_recurring and reminder.recurrence_rule:
+            if not reminder.is_delivered:
+                logger.info(
+                    "Recurring reminder #%d delivered to user_id=%d, "
+                    "next at %s (rule=%s, delivered_count=%d)",
+                    reminder.id,
+                    reminder.user_id,
+                    reminder.remind_at,
+                    reminder.recurrence_rule,
+                    reminder.delivered_count,
+                )
+            else:
+                logger.info(
+                    "Recurring reminder #%d final delivery to user_id=%d "
+                    "(recurrence ended, delivered_count=%d)",
+                    reminder.id,
+                    reminder.user_id,
+                    reminder.delivered_count,
+                )
+        else:
+            logger.info(
+                "Delivered reminder #%d to user_id=%d",
+                reminder.id,
+                reminder.user_id,
+            )
+
+
 reminder_engine = ReminderEngine()
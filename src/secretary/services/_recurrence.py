@@ -0,0 +1,42 @@
+"""반복 리마인더의 다음 알림 시간 계산.
+
+DB/ORM에 의존하지 않는 순수 날짜 연산만 모아 둔 모듈이다.
+모든 함수가 완전히 타입 주석되어 있어 mypyc로 그대로 컴파일할 수 있다.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# 평년 기준 월별 일수
+_MONTH_DAYS: tuple[int, ...] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def calculate_next_remind_at(current: datetime, rule: str) -> datetime:
+    """recurrence_rule에 따라 다음 알림 시간을 계산한다.
+
+    지원하는 규칙: daily, weekly, monthly
+    """
+    rule_lower = rule.strip().lower()
+    if rule_lower == "daily":
+        return current + timedelta(days=1)
+    elif rule_lower == "weekly":
+        return current + timedelta(weeks=1)
+    elif rule_lower == "monthly":
+        # 같은 일자를 유지하되, 해당 월의 마지막 일을 초과하지 않도록 처리
+        if current.month < 12:
+            year, month = current.year, current.month + 1
+        else:
+            year, month = current.year + 1, 1
+        day = min(current.day, _last_day(year, month))
+        return current.replace(year=year, month=month, day=day)
+    else:
+        # 알 수 없는 규칙은 daily로 fallback
+        return current + timedelta(days=1)
+
+
+@lru_cache(maxsize=2048)
+def _last_day(year: int, month: int) -> int:
+    """해당 월의 마지막 일을 반환한다 (윤년 2월은 29일)."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
@@ -1,15 +1,18 @@
-from calendar import monthrange
 from datetime import datetime, timedelta
 
-from sqlalchemy import or_, select
+from sqlalchemy import Row, delete, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from secretary.models.calendar import Event, Reminder
 from secretary.models.user import User
+from secretary.services._recurrence import calculate_next_remind_at
 
 
 # ── Event CRUD ─────────────────────────────────────────────
 
+# update_event로 수정 가능한 컬럼 이름
+_EVENT_COLUMNS = frozenset(Event.__table__.columns.keys())
+
 
 async def create_event(
     session: AsyncSession,
@@ -30,7 +33,6 @@ async def create_event(
     )
     session.add(event)
     await session.commit()
-    await session.refresh(event)
     return event
 
 
@@ -42,22 +44,33 @@ async def list_events(
     end: datetime | None = None,
 ) -> list[Event]:
     """List events in a date range, including family-visible ones."""
-    family_ids = await _get_family_member_ids(session, family_group_id) if family_group_id else []
-    conditions = [
-        or_(
-            Event.user_id == user_id,
-            (Event.user_id.in_(family_ids)) & (Event.visibility == "family"),
-        )
-    ]
-    if start:
-        conditions.append(Event.start_time >= start)
-    if end:
-        conditions.append(Event.start_time <= end)
+    conditions = await _event_conditions(session, user_id, family_group_id, start, end)
     stmt = select(Event).where(*conditions).order_by(Event.start_time)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+async def list_events_summary(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[Row]:
+    """list_events와 같은 조건으로 목록 표시에 필요한 컬럼만 조회한다.
+
+    ORM 객체 대신 (id, title, start_time, visibility) Row를 반환한다.
+    """
+    conditions = await _event_conditions(session, user_id, family_group_id, start, end)
+    stmt = (
+        select(Event.id, Event.title, Event.start_time, Event.visibility)
+        .where(*conditions)
+        .order_by(Event.start_time)
+    )
+    result = await session.execute(stmt)
+    return list(result.all())
+
+
 async def get_today_schedule(
     session: AsyncSession,
     user_id: int,
@@ -76,14 +89,22 @@ async def update_event(
     user_id: int,
     **kwargs,
 ) -> Event | None:
-    event = await session.get(Event, event_id)
-    if not event or event.user_id != user_id:
-        return None
-    for key, value in kwargs.items():
-        if hasattr(event, key):
-            setattr(event, key, value)
+    """본인 일정만 수정한다 (소유자 확인은 UPDATE의 WHERE 절에서 처리)."""
+    owned = (Event.id == event_id) & (Event.user_id == user_id)
+    values = {k: v for k, v in kwargs.items() if k in _EVENT_COLUMNS}
+    if not values:
+        result = await session.execute(select(Event).where(owned))
+        return result.scalar_one_or_none()
+
+    stmt = (
+        update(Event)
+        .where(owned)
+        .values(**values)
+        .returning(Event)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    event = (await session.execute(stmt)).scalar_one_or_none()
     await session.commit()
-    await session.refresh(event)
     return event
 
 
@@ -120,7 +141,6 @@ async def set_reminder(
     )
     session.add(reminder)
     await session.commit()
-    await session.refresh(reminder)
     return reminder
 
 
@@ -137,46 +157,32 @@ async def list_reminders(
     return list(result.scalars().all())
 
 
-async def get_due_reminders(session: AsyncSession, now: datetime | None = None) -> list[Reminder]:
-    """Get all undelivered reminders that are past due."""
+async def get_due_reminders(
+    session: AsyncSession,
+    now: datetime | None = None,
+    limit: int = 100,
+    after: tuple[datetime, int] | None = None,
+) -> list[Reminder]:
+    """Get undelivered reminders that are past due, in (remind_at, id) order (at most `limit`).
+
+    after: 이전 배치의 마지막 (remind_at, id). 지정하면 그 뒤부터 조회한다(keyset 페이징).
+    계속 전송에 실패하는 오래된 리마인더가 배치를 채워도 다음 배치는 그 뒤로 넘어간다.
+    """
     now = now or datetime.now()
+    conditions = [
+        # 리터럴 "is_delivered = 0"으로 렌더링되어야 부분 인덱스가 사용된다
+        Reminder.is_delivered == False,  # noqa: E712
+        Reminder.remind_at <= now,
+    ]
+    if after is not None:
+        conditions.append(tuple_(Reminder.remind_at, Reminder.id) > tuple_(*after))
     stmt = (
-        select(Reminder)
-        .where(
-            Reminder.is_delivered == False,  # noqa: E712
-            Reminder.remind_at <= now,
-        )
-        .order_by(Reminder.remind_at)
+        select(Reminder).where(*conditions).order_by(Reminder.remind_at, Reminder.id).limit(limit)
     )
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
-def calculate_next_remind_at(current: datetime, rule: str) -> datetime:
-    """recurrence_rule에 따라 다음 알림 시간을 계산한다.
-
-    지원하는 규칙: daily, weekly, monthly
-    """
-    rule_lower = rule.strip().lower()
-    if rule_lower == "daily":
-        return current + timedelta(days=1)
-    elif rule_lower == "weekly":
-        return current + timedelta(weeks=1)
-    elif rule_lower == "monthly":
-        # 같은 일자를 유지하되, 해당 월의 마지막 일을 초과하지 않도록 처리
-        year = current.year
-        month = current.month + 1
-        if month > 12:
-            month = 1
-            year += 1
-        max_day = monthrange(year, month)[1]
-        day = min(current.day, max_day)
-        return current.replace(year=year, month=month, day=day)
-    else:
-        # 알 수 없는 규칙은 daily로 fallback
-        return current + timedelta(days=1)
-
-
 def _is_recurrence_ended(reminder: Reminder, next_at: datetime) -> bool:
     """반복 종료 조건을 확인한다.
 
@@ -192,16 +198,39 @@ def _is_recurrence_ended(reminder: Reminder, next_at: datetime) -> bool:
     return False
 
 
-async def mark_delivered(session: AsyncSession, reminder_id: int) -> None:
-    """리마인더를 발송 완료 처리한다.
+async def mark_delivered(session: AsyncSession, reminder_id: int) -> Reminder | None:
+    """리마인더를 발송 완료 처리하고 갱신된 Reminder를 반환한다.
 
     반복 리마인더인 경우 다음 알림 시간을 계산하여 재설정한다.
     반복 종료 조건에 도달하면 최종 발송 완료로 마킹한다.
+    반환값은 커밋된 값과 같으므로 호출 측에서 refresh할 필요가 없다.
     """
     reminder = await session.get(Reminder, reminder_id)
     if not reminder:
+        return None
+
+    _apply_delivery(reminder)
+    await session.commit()
+    return reminder
+
+
+async def mark_delivered_bulk(session: AsyncSession, reminder_ids: list[int]) -> None:
+    """여러 리마인더를 한 번에 발송 완료 처리한다.
+
+    한 번의 SELECT로 불러와 mark_delivered()와 같은 _apply_delivery()를 적용하고
+    한 번만 커밋한다. 처리 결과는 세션에 로드된 Reminder 객체에도 반영된다.
+    """
+    if not reminder_ids:
         return
 
+    result = await session.execute(select(Reminder).where(Reminder.id.in_(reminder_ids)))
+    for reminder in result.scalars():
+        _apply_delivery(reminder)
+    await session.commit()
+
+
+def _apply_delivery(reminder: Reminder) -> None:
+    """발송 1회를 반영한다: 반복 리마인더는 다음 시간으로 재설정하거나 종료한다."""
     reminder.delivered_count += 1
 
     if reminder.is_recurring and reminder.recurrence_rule:
@@ -217,21 +246,39 @@ async def mark_delivered(session: AsyncSession, reminder_id: int) -> None:
         # 일회성 리마인더 → 발송 완료
         reminder.is_delivered = True
 
-    await session.commit()
-
 
 async def cancel_reminder(session: AsyncSession, reminder_id: int, user_id: int) -> bool:
-    reminder = await session.get(Reminder, reminder_id)
-    if not reminder or reminder.user_id != user_id:
-        return False
-    await session.delete(reminder)
+    """본인 리마인더만 삭제한다 (소유자 확인은 DELETE의 WHERE 절에서 처리)."""
+    stmt = delete(Reminder).where(Reminder.id == reminder_id, Reminder.user_id == user_id)
+    result = await session.execute(stmt)
     await session.commit()
-    return True
+    return result.rowcount > 0
 
 
 # ── Helpers ────────────────────────────────────────────────
 
 
+async def _event_conditions(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> list:
+    family_ids = await _get_family_member_ids(session, family_group_id) if family_group_id else []
+    conditions = [
+        or_(
+            Event.user_id == user_id,
+            (Event.user_id.in_(family_ids)) & (Event.visibility == "family"),
+        )
+    ]
+    if start:
+        conditions.append(Event.start_time >= start)
+    if end:
+        conditions.append(Event.start_time <= end)
+    return conditions
+
+
 async def _get_family_member_ids(session: AsyncSession, family_group_id: int) -> list[int]:
     stmt = select(User.id).where(User.family_group_id == family_group_id)
     result = await session.execute(stmt)
@@ -11,6 +11,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from secretary.models.conversation import ConversationHistory
 
+_HISTORY_HEADER = (
+    "\n\n## 이전 대화 이력 (최근)\n"
+    "아래는 이전 세션에서의 대화 내용입니다. 자연스럽게 이어서 대화하세요.\n"
+)
+
+# 역할별 표시 라벨 (user 외의 역할은 모두 비서로 표시)
+_ROLE_LABEL = {"user": "[사용자]", "assistant": "[비서]"}
+
 
 async def get_recent_conversations(
     session: AsyncSession,
@@ -63,7 +71,12 @@ async def cleanup_old_conversations(
     """
     cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-    stmt = delete(ConversationHistory).where(ConversationHistory.created_at < cutoff)
+    # 세션에 로드된 객체와 동기화하지 않는다 (naive/aware datetime 비교 오류 방지)
+    stmt = (
+        delete(ConversationHistory)
+        .where(ConversationHistory.created_at < cutoff)
+        .execution_options(synchronize_session=False)
+    )
     result = await session.execute(stmt)
     await session.commit()
 
@@ -82,13 +95,6 @@ def format_conversation_history(messages: list[ConversationHistory]) -> str:
     if not messages:
         return ""
 
-    lines = []
-    for msg in messages:
-        role_label = "사용자" if msg.role == "user" else "비서"
-        lines.append(f"[{role_label}] {msg.content}")
-
-    return (
-        "\n\n## 이전 대화 이력 (최근)\n"
-        "아래는 이전 세션에서의 대화 내용입니다. 자연스럽게 이어서 대화하세요.\n\n"
-        + "\n".join(lines)
-    )
+    lines = [_HISTORY_HEADER]
+    lines.extend(f"{_ROLE_LABEL.get(msg.role, '[비서]')} {msg.content}" for msg in messages)
+    return "\n".join(lines)
@@ -1,4 +1,4 @@
-from sqlalchemy import or_, select
+from sqlalchemy import Row, delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from secretary.models.memo import Memo, Todo
@@ -7,6 +7,9 @@ from secretary.models.user import User
 
 # ── Memo CRUD ──────────────────────────────────────────────
 
+# update_memo로 수정 가능한 컬럼 이름
+_MEMO_COLUMNS = frozenset(Memo.__table__.columns.keys())
+
 
 async def create_memo(
     session: AsyncSession,
@@ -25,7 +28,6 @@ async def create_memo(
     )
     session.add(memo)
     await session.commit()
-    await session.refresh(memo)
     return memo
 
 
@@ -36,21 +38,32 @@ async def list_memos(
     include_family: bool = True,
 ) -> list[Memo]:
     """List user's own memos + family-visible memos from same group."""
-    conditions = [Memo.user_id == user_id]
-    if include_family and family_group_id:
-        # Also include family-visible memos from other family members
-        family_member_ids = await _get_family_member_ids(session, family_group_id)
-        conditions = [
-            or_(
-                Memo.user_id == user_id,
-                (Memo.user_id.in_(family_member_ids)) & (Memo.visibility == "family"),
-            )
-        ]
+    conditions = await _memo_conditions(session, user_id, family_group_id, include_family)
     stmt = select(Memo).where(*conditions).order_by(Memo.created_at.desc())
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+async def list_memos_summary(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None = None,
+    include_family: bool = True,
+) -> list[Row]:
+    """list_memos와 같은 조건으로 목록 표시에 필요한 컬럼만 조회한다.
+
+    ORM 객체 대신 (id, title, visibility) Row를 반환한다.
+    """
+    conditions = await _memo_conditions(session, user_id, family_group_id, include_family)
+    stmt = (
+        select(Memo.id, Memo.title, Memo.visibility)
+        .where(*conditions)
+        .order_by(Memo.created_at.desc())
+    )
+    result = await session.execute(stmt)
+    return list(result.all())
+
+
 async def search_memos(
     session: AsyncSession,
     user_id: int,
@@ -88,28 +101,38 @@ async def update_memo(
     user_id: int,
     **kwargs,
 ) -> Memo | None:
-    memo = await session.get(Memo, memo_id)
-    if not memo or memo.user_id != user_id:
-        return None
-    for key, value in kwargs.items():
-        if hasattr(memo, key):
-            setattr(memo, key, value)
+    """본인 메모만 수정한다 (소유자 확인은 UPDATE의 WHERE 절에서 처리)."""
+    owned = (Memo.id == memo_id) & (Memo.user_id == user_id)
+    values = {k: v for k, v in kwargs.items() if k in _MEMO_COLUMNS}
+    if not values:
+        result = await session.execute(select(Memo).where(owned))
+        return result.scalar_one_or_none()
+
+    stmt = (
+        update(Memo)
+        .where(owned)
+        .values(**values)
+        .returning(Memo)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    memo = (await session.execute(stmt)).scalar_one_or_none()
     await session.commit()
-    await session.refresh(memo)
     return memo
 
 
 async def delete_memo(session: AsyncSession, memo_id: int, user_id: int) -> bool:
-    memo = await session.get(Memo, memo_id)
-    if not memo or memo.user_id != user_id:
-        return False
-    await session.delete(memo)
+    """본인 메모만 삭제한다 (소유자 확인은 DELETE의 WHERE 절에서 처리)."""
+    stmt = delete(Memo).where(Memo.id == memo_id, Memo.user_id == user_id)
+    result = await session.execute(stmt)
     await session.commit()
-    return True
+    return result.rowcount > 0
 
 
 # ── Todo CRUD ──────────────────────────────────────────────
 
+# update_todo로 수정 가능한 컬럼 이름
+_TODO_COLUMNS = frozenset(Todo.__table__.columns.keys())
+
 
 async def create_todo(
     session: AsyncSession,
@@ -128,7 +151,6 @@ async def create_todo(
     )
     session.add(todo)
     await session.commit()
-    await session.refresh(todo)
     return todo
 
 
@@ -139,31 +161,48 @@ async def list_todos(
     include_done: bool = False,
     include_family: bool = True,
 ) -> list[Todo]:
-    conditions = []
-    if include_family and family_group_id:
-        family_member_ids = await _get_family_member_ids(session, family_group_id)
-        conditions.append(
-            or_(
-                Todo.user_id == user_id,
-                (Todo.user_id.in_(family_member_ids)) & (Todo.visibility == "family"),
-            )
-        )
-    else:
-        conditions.append(Todo.user_id == user_id)
-    if not include_done:
-        conditions.append(Todo.is_done == False)  # noqa: E712
+    conditions = await _todo_conditions(
+        session, user_id, family_group_id, include_done, include_family
+    )
     stmt = select(Todo).where(*conditions).order_by(Todo.priority.desc(), Todo.created_at.desc())
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+async def list_todos_summary(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None = None,
+    include_done: bool = False,
+    include_family: bool = True,
+) -> list[Row]:
+    """list_todos와 같은 조건으로 목록 표시에 필요한 컬럼만 조회한다.
+
+    ORM 객체 대신 (id, title, is_done, priority, due_date) Row를 반환한다.
+    """
+    conditions = await _todo_conditions(
+        session, user_id, family_group_id, include_done, include_family
+    )
+    stmt = (
+        select(Todo.id, Todo.title, Todo.is_done, Todo.priority, Todo.due_date)
+        .where(*conditions)
+        .order_by(Todo.priority.desc(), Todo.created_at.desc())
+    )
+    result = await session.execute(stmt)
+    return list(result.all())
+
+
 async def toggle_todo(session: AsyncSession, todo_id: int, user_id: int) -> Todo | None:
-    todo = await session.get(Todo, todo_id)
-    if not todo or todo.user_id != user_id:
-        return None
-    todo.is_done = not todo.is_done
+    """본인 할일의 완료 상태를 단일 UPDATE로 뒤집는다 (read-modify-write 없음)."""
+    stmt = (
+        update(Todo)
+        .where(Todo.id == todo_id, Todo.user_id == user_id)
+        .values(is_done=~Todo.is_done)
+        .returning(Todo)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    todo = (await session.execute(stmt)).scalar_one_or_none()
     await session.commit()
-    await session.refresh(todo)
     return todo
 
 
@@ -173,29 +212,77 @@ async def update_todo(
     user_id: int,
     **kwargs,
 ) -> Todo | None:
-    todo = await session.get(Todo, todo_id)
-    if not todo or todo.user_id != user_id:
-        return None
-    for key, value in kwargs.items():
-        if hasattr(todo, key):
-            setattr(todo, key, value)
+    """본인 할일만 수정한다 (소유자 확인은 UPDATE의 WHERE 절에서 처리)."""
+    owned = (Todo.id == todo_id) & (Todo.user_id == user_id)
+    values = {k: v for k, v in kwargs.items() if k in _TODO_COLUMNS}
+    if not values:
+        result = await session.execute(select(Todo).where(owned))
+        return result.scalar_one_or_none()
+
+    stmt = (
+        update(Todo)
+        .where(owned)
+        .values(**values)
+        .returning(Todo)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    todo = (await session.execute(stmt)).scalar_one_or_none()
     await session.commit()
-    await session.refresh(todo)
     return todo
 
 
 async def delete_todo(session: AsyncSession, todo_id: int, user_id: int) -> bool:
-    todo = await session.get(Todo, todo_id)
-    if not todo or todo.user_id != user_id:
-        return False
-    await session.delete(todo)
+    """본인 할일만 삭제한다 (소유자 확인은 DELETE의 WHERE 절에서 처리)."""
+    stmt = delete(Todo).where(Todo.id == todo_id, Todo.user_id == user_id)
+    result = await session.execute(stmt)
     await session.commit()
-    return True
+    return result.rowcount > 0
 
 
 # ── Helpers ────────────────────────────────────────────────
 
 
+async def _memo_conditions(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None,
+    include_family: bool,
+) -> list:
+    if include_family and family_group_id:
+        # Also include family-visible memos from other family members
+        family_member_ids = await _get_family_member_ids(session, family_group_id)
+        return [
+            or_(
+                Memo.user_id == user_id,
+                (Memo.user_id.in_(family_member_ids)) & (Memo.visibility == "family"),
+            )
+        ]
+    return [Memo.user_id == user_id]
+
+
+async def _todo_conditions(
+    session: AsyncSession,
+    user_id: int,
+    family_group_id: int | None,
+    include_done: bool,
+    include_family: bool,
+) -> list:
+    conditions = []
+    if include_family and family_group_id:
+        family_member_ids = await _get_family_member_ids(session, family_group_id)
+        conditions.append(
+            or_(
+                Todo.user_id == user_id,
+                (Todo.user_id.in_(family_member_ids)) & (Todo.visibility == "family"),
+            )
+        )
+    else:
+        conditions.append(Todo.user_id == user_id)
+    if not include_done:
+        conditions.append(Todo.is_done == False)  # noqa: E712
+    return conditions
+
+
 async def _get_family_member_ids(session: AsyncSession, family_group_id: int) -> list[int]:
     stmt = select(User.id).where(User.family_group_id == family_group_id)
     result = await session.execute(stmt)
@@ -2,7 +2,8 @@ import secrets
 import string
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import settings
@@ -61,35 +62,74 @@ async def validate_invite_code(session: AsyncSession, code: str) -> FamilyInvite
     return invite
 
 
-async def use_invite_code(session: AsyncSession, invite: FamilyInvite) -> None:
-    """Increment the use count of an invite code."""
-    invite.use_count += 1
-    await session.commit()
+async def use_invite_code(
+    session: AsyncSession, invite: FamilyInvite, *, commit: bool = True
+) -> bool:
+    """Increment the use count of an invite code if it is still usable.
+
+    The validity checks (active, not expired, below max_uses) are part of the
+    UPDATE's WHERE clause and the increment happens in SQL, so concurrent joins
+    can neither be lost nor push use_count past max_uses. RETURNING updates the
+    passed-in instance without a refresh.
+    With commit=False the increment stays in the caller's transaction, so it is
+    rolled back together with the caller's other changes.
+
+    Returns False if the invite was exhausted, expired or deactivated meanwhile.
+    """
+    stmt = (
+        update(FamilyInvite)
+        .where(
+            FamilyInvite.id == invite.id,
+            FamilyInvite.is_active.is_(True),
+            FamilyInvite.expires_at > datetime.now(),
+            or_(
+                FamilyInvite.max_uses.is_(None),
+                FamilyInvite.use_count < FamilyInvite.max_uses,
+            ),
+        )
+        .values(use_count=FamilyInvite.use_count + 1)
+        .returning(FamilyInvite)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    used = (await session.execute(stmt)).scalar_one_or_none() is not None
+    if commit:
+        await session.commit()
+    return used
 
 
 async def deactivate_invite(
     session: AsyncSession, invite_id: int, user_id: int
 ) -> bool:
-    """Deactivate an invite code. Only the creator can deactivate."""
-    invite = await session.get(FamilyInvite, invite_id)
-    if not invite or invite.created_by != user_id:
-        return False
-    invite.is_active = False
+    """Deactivate an invite code. Only the creator can deactivate.
+
+    The creator check is part of the UPDATE's WHERE clause (one round-trip).
+    """
+    stmt = (
+        update(FamilyInvite)
+        .where(FamilyInvite.id == invite_id, FamilyInvite.created_by == user_id)
+        .values(is_active=False)
+        .returning(FamilyInvite.id)
+    )
+    deactivated = (await session.execute(stmt)).scalar_one_or_none() is not None
     await session.commit()
-    return True
+    return deactivated
 
 
 async def list_family_invites(
     session: AsyncSession, user_id: int
 ) -> list[FamilyInvite]:
-    """List active invites for the user's family group. Admin only."""
-    user = await session.get(User, user_id)
-    if not user or user.role != "admin":
-        return []
+    """List active invites for the user's family group. Admin only.
 
-    stmt = select(FamilyInvite).where(
-        FamilyInvite.family_group_id == user.family_group_id,
-        FamilyInvite.is_active.is_(True),
+    The admin check is a join condition, so this is a single round-trip.
+    """
+    stmt = (
+        select(FamilyInvite)
+        .join(User, User.family_group_id == FamilyInvite.family_group_id)
+        .where(
+            User.id == user_id,
+            User.role == "admin",
+            FamilyInvite.is_active.is_(True),
+        )
     )
     result = await session.execute(stmt)
     return list(result.scalars().all())
@@ -125,11 +165,12 @@ async def get_or_create_user(
     if invite_code:
         invite = await validate_invite_code(session, invite_code)
 
-    if invite:
+    # 사용자/링크와 같은 트랜잭션에서 커밋해야 아래 롤백 시 사용 횟수도 함께 취소된다.
+    # 검증 후 다른 요청이 마지막 사용 횟수를 가져갔으면 초대 없이 가입한 것으로 처리한다.
+    if invite and await use_invite_code(session, invite, commit=False):
         # Join existing family as member
         family_group_id = invite.family_group_id
         role = "member"
-        await use_invite_code(session, invite)
     else:
         # Create new family group, user as admin
         family_group = FamilyGroup(name=settings.default_family_name)
@@ -154,7 +195,17 @@ async def get_or_create_user(
         is_primary=True,
     )
     session.add(link)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration of the same platform account:
+        # discard our group/user rows and the invite use (all uncommitted) and return the winner.
+        await session.rollback()
+        result = await session.execute(stmt)
+        existing = result.scalar_one_or_none()
+        if existing is None:
+            raise
+        return existing
     return user
 
 
@@ -176,13 +227,22 @@ async def get_user_by_platform(
 
 
 async def get_family_members(session: AsyncSession, user_id: int) -> list[User]:
-    """Get all members in the same family group."""
-    user = await session.get(User, user_id)
-    if not user:
-        return []
-    stmt = (
-        select(User).where(User.family_group_id == user.family_group_id).order_by(User.created_at)
-    )
+    """Get all members in the same family group.
+
+    Resolves the user's group in a subquery so it is a single round-trip.
+    Returns an empty list if the user does not exist.
+    """
+    group_id = select(User.family_group_id).where(User.id == user_id)
+    stmt = select(User).where(User.family_group_id.in_(group_id)).order_by(User.created_at)
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def get_family_members_by_group(
+    session: AsyncSession, family_group_id: int
+) -> list[User]:
+    """Get all members of a family group (for callers that already know the group)."""
+    stmt = select(User).where(User.family_group_id == family_group_id).order_by(User.created_at)
     result = await session.execute(stmt)
     return list(result.scalars().all())
 
@@ -25,6 +25,10 @@ _DASHBOARD_HTML = Path(__file__).parent / "dashboard.html"
 _BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
 _LOG_FILE = _BASE_DIR / "logs" / "secretary.log"
 
+# 응답 전송 후 SIGTERM을 보내기 위한 지연 시간 (초)
+_SHUTDOWN_DELAY_SECONDS = 0.1
+_shutting_down = False
+
 
 @router.get("/", response_class=HTMLResponse)
 async def dashboard():
@@ -180,7 +184,17 @@ async def reset_all_sessions():
 
 @router.post("/api/shutdown")
 async def shutdown():
-    """SIGTERM을 전송한다 (launchd가 자동 재시작)."""
+    """SIGTERM을 전송한다 (launchd가 자동 재시작).
+
+    응답이 먼저 전송되도록 시그널은 약간 지연시켜 보내고, 중복 요청은 무시한다.
+    """
+    global _shutting_down
+    if _shutting_down:
+        return {"ok": True, "already": True, "message": "Shutdown already in progress"}
+
+    _shutting_down = True
     logger.warning("Shutdown requested via dashboard")
-    os.kill(os.getpid(), signal.SIGTERM)
+    asyncio.get_running_loop().call_later(
+        _SHUTDOWN_DELAY_SECONDS, os.kill, os.getpid(), signal.SIGTERM
+    )
     return {"ok": True, "message": "SIGTERM sent"}
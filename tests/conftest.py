@@ -1,7 +1,13 @@
-"""Shared fixtures: in-memory SQLite database for all tests."""
+"""Shared fixtures: in-memory SQLite database for all tests.
+
+스키마는 테스트 세션당 한 번만 생성하고, 각 테스트는 롤백되는 외부 트랜잭션 안에서
+SAVEPOINT 단위로 실행되어 서로 격리된다.
+"""
 
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from secretary.models.database import Base
 
@@ -10,22 +16,58 @@ from secretary.models.user import FamilyGroup, FamilyInvite, User, UserPlatformL
 from secretary.models.memo import Memo, Todo  # noqa: F401
 from secretary.models.calendar import Event, Reminder  # noqa: F401
 from secretary.models.conversation import ConversationHistory  # noqa: F401
+from secretary.services.user_service import get_or_create_user
 
 
-@pytest_asyncio.fixture
-async def db_session():
-    """Create a fresh in-memory SQLite database for each test."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():
+    """Create the in-memory SQLite database and schema once per test session."""
+    # StaticPool: 모든 연결이 같은 in-memory DB를 공유한다
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    # pysqlite/aiosqlite의 암시적 트랜잭션 처리를 끄고 BEGIN을 직접 보내야 SAVEPOINT가 동작한다
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_factory() as session:
-        yield session
+    yield engine
 
     await engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def db_session(db_engine):
+    """Run each test inside an outer transaction that is rolled back afterwards.
+
+    서비스 코드의 commit()은 SAVEPOINT 해제로 처리되므로 테스트 간 데이터가 남지 않는다.
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest_asyncio.fixture
+async def sample_admin(db_session: AsyncSession) -> User:
+    """Register the first telegram user (tg_001, 아빠), who becomes a new family's admin."""
+    return await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+
+
 @pytest_asyncio.fixture
 async def sample_family(db_session: AsyncSession):
     """Create a family group with two users (admin + member) for testing."""
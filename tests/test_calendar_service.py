@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from secretary.models.calendar import Event
 from secretary.services.calendar_service import (
     calculate_next_remind_at,
     cancel_reminder,
@@ -12,12 +13,18 @@ from secretary.services.calendar_service import (
     get_due_reminders,
     get_today_schedule,
     list_events,
+    list_events_summary,
     list_reminders,
     mark_delivered,
+    mark_delivered_bulk,
     set_reminder,
     update_event,
 )
 
+NOW = datetime(2026, 3, 1, 12, 0)
+MAR1_0900 = datetime(2026, 3, 1, 9, 0)
+MAR1_1000 = datetime(2026, 3, 1, 10, 0)
+
 
 # ── Event Tests ───────────────────────────────────────────
 
@@ -26,9 +33,8 @@ from secretary.services.calendar_service import (
 async def test_create_and_list_event(sample_family, db_session):
     admin = sample_family["admin"]
     group = sample_family["group"]
-    start = datetime(2026, 3, 1, 10, 0)
 
-    event = await create_event(db_session, admin.id, "병원 예약", start, description="내과")
+    event = await create_event(db_session, admin.id, "병원 예약", MAR1_1000, description="내과")
 
     assert event.id is not None
     assert event.visibility == "family"  # default
@@ -43,10 +49,14 @@ async def test_event_family_visibility(sample_family, db_session):
     admin = sample_family["admin"]
     member = sample_family["member"]
     group = sample_family["group"]
-    start = datetime(2026, 3, 1, 10, 0)
 
-    await create_event(db_session, admin.id, "가족 일정", start, visibility="family")
-    await create_event(db_session, admin.id, "개인 일정", start, visibility="private")
+    db_session.add_all(
+        [
+            Event(user_id=admin.id, title="가족 일정", start_time=MAR1_1000, visibility="family"),
+            Event(user_id=admin.id, title="개인 일정", start_time=MAR1_1000, visibility="private"),
+        ]
+    )
+    await db_session.commit()
 
     member_events = await list_events(db_session, member.id, group.id)
     assert len(member_events) == 1
@@ -58,8 +68,13 @@ async def test_list_events_date_range(sample_family, db_session):
     admin = sample_family["admin"]
     group = sample_family["group"]
 
-    await create_event(db_session, admin.id, "3월 일정", datetime(2026, 3, 15, 10, 0))
-    await create_event(db_session, admin.id, "4월 일정", datetime(2026, 4, 15, 10, 0))
+    db_session.add_all(
+        [
+            Event(user_id=admin.id, title="3월 일정", start_time=datetime(2026, 3, 15, 10, 0)),
+            Event(user_id=admin.id, title="4월 일정", start_time=datetime(2026, 4, 15, 10, 0)),
+        ]
+    )
+    await db_session.commit()
 
     march_events = await list_events(
         db_session,
@@ -72,16 +87,38 @@ async def test_list_events_date_range(sample_family, db_session):
     assert march_events[0].title == "3월 일정"
 
 
+@pytest.mark.asyncio
+async def test_list_events_summary(sample_family, db_session):
+    """요약 조회는 list_events와 같은 가시성 규칙으로 필요한 컬럼만 반환한다."""
+    admin = sample_family["admin"]
+    member = sample_family["member"]
+    group = sample_family["group"]
+
+    event = await create_event(db_session, admin.id, "가족 일정", MAR1_1000, visibility="family")
+    await create_event(db_session, admin.id, "개인 일정", MAR1_1000, visibility="private")
+
+    rows = await list_events_summary(db_session, member.id, group.id)
+    assert len(rows) == 1
+    assert rows[0].id == event.id
+    assert rows[0].title == "가족 일정"
+    assert rows[0].start_time == MAR1_1000
+    assert rows[0].visibility == "family"
+
+
 @pytest.mark.asyncio
 async def test_get_today_schedule(sample_family, db_session):
     admin = sample_family["admin"]
     group = sample_family["group"]
-    now = datetime(2026, 3, 1, 12, 0)
 
-    await create_event(db_session, admin.id, "오늘 일정", datetime(2026, 3, 1, 14, 0))
-    await create_event(db_session, admin.id, "내일 일정", datetime(2026, 3, 2, 10, 0))
+    db_session.add_all(
+        [
+            Event(user_id=admin.id, title="오늘 일정", start_time=datetime(2026, 3, 1, 14, 0)),
+            Event(user_id=admin.id, title="내일 일정", start_time=datetime(2026, 3, 2, 10, 0)),
+        ]
+    )
+    await db_session.commit()
 
-    today = await get_today_schedule(db_session, admin.id, group.id, now=now)
+    today = await get_today_schedule(db_session, admin.id, group.id, now=NOW)
     assert len(today) == 1
     assert today[0].title == "오늘 일정"
 
@@ -89,8 +126,7 @@ async def test_get_today_schedule(sample_family, db_session):
 @pytest.mark.asyncio
 async def test_update_event(sample_family, db_session):
     admin = sample_family["admin"]
-    start = datetime(2026, 3, 1, 10, 0)
-    event = await create_event(db_session, admin.id, "원래 일정", start)
+    event = await create_event(db_session, admin.id, "원래 일정", MAR1_1000)
 
     updated = await update_event(db_session, event.id, admin.id, title="수정된 일정")
     assert updated.title == "수정된 일정"
@@ -100,7 +136,7 @@ async def test_update_event(sample_family, db_session):
 async def test_update_event_wrong_owner(sample_family, db_session):
     admin = sample_family["admin"]
     member = sample_family["member"]
-    event = await create_event(db_session, admin.id, "아빠 일정", datetime(2026, 3, 1, 10, 0))
+    event = await create_event(db_session, admin.id, "아빠 일정", MAR1_1000)
 
     result = await update_event(db_session, event.id, member.id, title="해킹")
     assert result is None
@@ -109,7 +145,7 @@ async def test_update_event_wrong_owner(sample_family, db_session):
 @pytest.mark.asyncio
 async def test_delete_event(sample_family, db_session):
     admin = sample_family["admin"]
-    event = await create_event(db_session, admin.id, "삭제할 일정", datetime(2026, 3, 1, 10, 0))
+    event = await create_event(db_session, admin.id, "삭제할 일정", MAR1_1000)
 
     assert await delete_event(db_session, event.id, admin.id) is True
     assert await delete_event(db_session, event.id, admin.id) is False
@@ -121,9 +157,8 @@ async def test_delete_event(sample_family, db_session):
 @pytest.mark.asyncio
 async def test_set_and_list_reminders(sample_family, db_session):
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
-    reminder = await set_reminder(db_session, admin.id, "약 먹기", remind_at)
+    reminder = await set_reminder(db_session, admin.id, "약 먹기", MAR1_0900)
     assert reminder.id is not None
     assert reminder.is_delivered is False
 
@@ -134,26 +169,54 @@ async def test_set_and_list_reminders(sample_family, db_session):
 @pytest.mark.asyncio
 async def test_get_due_reminders(sample_family, db_session):
     admin = sample_family["admin"]
-    now = datetime(2026, 3, 1, 12, 0)
 
-    await set_reminder(db_session, admin.id, "과거 리마인더", now - timedelta(hours=1))
-    await set_reminder(db_session, admin.id, "미래 리마인더", now + timedelta(hours=1))
+    await set_reminder(db_session, admin.id, "과거 리마인더", NOW - timedelta(hours=1))
+    await set_reminder(db_session, admin.id, "미래 리마인더", NOW + timedelta(hours=1))
 
-    due = await get_due_reminders(db_session, now)
+    due = await get_due_reminders(db_session, NOW)
     assert len(due) == 1
     assert due[0].message == "과거 리마인더"
 
 
+@pytest.mark.asyncio
+async def test_get_due_reminders_limit(sample_family, db_session):
+    """limit 개수만큼 오래된 리마인더부터 반환한다."""
+    admin = sample_family["admin"]
+
+    for hours in (3, 1, 2):
+        await set_reminder(db_session, admin.id, f"{hours}시간 전", NOW - timedelta(hours=hours))
+
+    due = await get_due_reminders(db_session, NOW, limit=2)
+    assert [r.message for r in due] == ["3시간 전", "2시간 전"]
+
+
+@pytest.mark.asyncio
+async def test_get_due_reminders_after_cursor(sample_family, db_session):
+    """limit보다 많은 오래된 리마인더 뒤의 커서부터 조회하면 더 최근 리마인더가 반환된다."""
+    admin = sample_family["admin"]
+
+    # 같은 remind_at은 id 순으로 정렬된다
+    stuck_at = NOW - timedelta(hours=3)
+    stuck = [await set_reminder(db_session, admin.id, f"실패 {i}", stuck_at) for i in range(3)]
+    await set_reminder(db_session, admin.id, "최근", NOW - timedelta(minutes=1))
+
+    first = await get_due_reminders(db_session, NOW, limit=2)
+    assert [r.id for r in first] == [stuck[0].id, stuck[1].id]
+
+    last = first[-1]
+    second = await get_due_reminders(db_session, NOW, limit=2, after=(last.remind_at, last.id))
+    assert [r.message for r in second] == ["실패 2", "최근"]
+
+
 @pytest.mark.asyncio
 async def test_mark_delivered(sample_family, db_session):
     admin = sample_family["admin"]
-    now = datetime(2026, 3, 1, 12, 0)
-    reminder = await set_reminder(db_session, admin.id, "전송할 리마인더", now - timedelta(hours=1))
+    reminder = await set_reminder(db_session, admin.id, "전송할 리마인더", NOW - timedelta(hours=1))
 
     await mark_delivered(db_session, reminder.id)
 
     # Should no longer appear in due reminders
-    due = await get_due_reminders(db_session, now)
+    due = await get_due_reminders(db_session, NOW)
     assert len(due) == 0
 
     # Should not appear in default list (exclude delivered)
@@ -169,16 +232,19 @@ async def test_mark_delivered(sample_family, db_session):
 async def test_mark_delivered_increments_delivered_count(sample_family, db_session):
     """일회성 리마인더도 delivered_count가 증가하는지 확인."""
     admin = sample_family["admin"]
-    now = datetime(2026, 3, 1, 12, 0)
-    reminder = await set_reminder(db_session, admin.id, "일회성", now - timedelta(hours=1))
+    reminder = await set_reminder(db_session, admin.id, "일회성", NOW - timedelta(hours=1))
 
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.is_delivered is True
     assert reminder.delivered_count == 1
 
 
+@pytest.mark.asyncio
+async def test_mark_delivered_missing(db_session):
+    assert await mark_delivered(db_session, 99999) is None
+
+
 @pytest.mark.asyncio
 async def test_cancel_reminder(sample_family, db_session):
     admin = sample_family["admin"]
@@ -202,15 +268,13 @@ async def test_cancel_reminder_wrong_owner(sample_family, db_session):
 
 def test_calculate_next_daily():
     """daily 규칙: 하루 뒤."""
-    base = datetime(2026, 3, 1, 9, 0)
-    result = calculate_next_remind_at(base, "daily")
+    result = calculate_next_remind_at(MAR1_0900, "daily")
     assert result == datetime(2026, 3, 2, 9, 0)
 
 
 def test_calculate_next_weekly():
     """weekly 규칙: 7일 뒤."""
-    base = datetime(2026, 3, 1, 9, 0)
-    result = calculate_next_remind_at(base, "weekly")
+    result = calculate_next_remind_at(MAR1_0900, "weekly")
     assert result == datetime(2026, 3, 8, 9, 0)
 
 
@@ -229,6 +293,13 @@ def test_calculate_next_monthly_end_of_month():
     assert result == datetime(2026, 2, 28, 9, 0)
 
 
+def test_calculate_next_monthly_leap_year():
+    """monthly 규칙: 윤년 1월 31일 -> 2월 29일."""
+    base = datetime(2028, 1, 31, 9, 0)
+    result = calculate_next_remind_at(base, "monthly")
+    assert result == datetime(2028, 2, 29, 9, 0)
+
+
 def test_calculate_next_monthly_december_to_january():
     """monthly 규칙: 12월 -> 다음 해 1월."""
     base = datetime(2026, 12, 15, 9, 0)
@@ -238,8 +309,7 @@ def test_calculate_next_monthly_december_to_january():
 
 def test_calculate_next_unknown_rule_fallback():
     """알 수 없는 규칙은 daily로 fallback."""
-    base = datetime(2026, 3, 1, 9, 0)
-    result = calculate_next_remind_at(base, "unknown_rule")
+    result = calculate_next_remind_at(MAR1_0900, "unknown_rule")
     assert result == datetime(2026, 3, 2, 9, 0)
 
 
@@ -250,28 +320,25 @@ def test_calculate_next_unknown_rule_fallback():
 async def test_recurring_daily_reminder_reschedules(sample_family, db_session):
     """매일 반복 리마인더: mark_delivered 후 다음 날로 재설정된다."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "매일 약 먹기",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="daily",
     )
 
     # 첫 번째 발송
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.is_delivered is False  # 아직 반복 중
     assert reminder.remind_at == datetime(2026, 3, 2, 9, 0)
     assert reminder.delivered_count == 1
 
     # 두 번째 발송
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.is_delivered is False
     assert reminder.remind_at == datetime(2026, 3, 3, 9, 0)
@@ -282,19 +349,17 @@ async def test_recurring_daily_reminder_reschedules(sample_family, db_session):
 async def test_recurring_weekly_reminder_reschedules(sample_family, db_session):
     """매주 반복 리마인더: mark_delivered 후 7일 뒤로 재설정된다."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "주간 회의",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="weekly",
     )
 
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.is_delivered is False
     assert reminder.remind_at == datetime(2026, 3, 8, 9, 0)
@@ -317,15 +382,13 @@ async def test_recurring_monthly_reminder_reschedules(sample_family, db_session)
     )
 
     # 1/31 -> 2/28 (2026년은 평년)
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.is_delivered is False
     assert reminder.remind_at == datetime(2026, 2, 28, 9, 0)
 
     # 2/28 -> 3/28
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
 
     assert reminder.remind_at == datetime(2026, 3, 28, 9, 0)
 
@@ -334,35 +397,31 @@ async def test_recurring_monthly_reminder_reschedules(sample_family, db_session)
 async def test_recurring_reminder_stops_at_count(sample_family, db_session):
     """횟수 제한 반복 리마인더: recurrence_count에 도달하면 is_delivered=True."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "3회 반복",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="daily",
         recurrence_count=3,
     )
 
     # 1회차 발송
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is False
     assert reminder.delivered_count == 1
     assert reminder.remind_at == datetime(2026, 3, 2, 9, 0)
 
     # 2회차 발송
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is False
     assert reminder.delivered_count == 2
     assert reminder.remind_at == datetime(2026, 3, 3, 9, 0)
 
     # 3회차 발송 → 종료
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is True
     assert reminder.delivered_count == 3
 
@@ -371,34 +430,30 @@ async def test_recurring_reminder_stops_at_count(sample_family, db_session):
 async def test_recurring_reminder_stops_at_end_date(sample_family, db_session):
     """종료일 제한 반복 리마인더: 다음 알림이 종료일을 넘으면 is_delivered=True."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
     end_date = datetime(2026, 3, 3, 23, 59)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "종료일 반복",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="daily",
         recurrence_end_date=end_date,
     )
 
     # 1회차: 3/1 -> 3/2 (종료일 이전)
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is False
     assert reminder.remind_at == datetime(2026, 3, 2, 9, 0)
 
     # 2회차: 3/2 -> 3/3 (종료일 이전)
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is False
     assert reminder.remind_at == datetime(2026, 3, 3, 9, 0)
 
     # 3회차: 3/3 -> 3/4 (종료일 초과) → 종료
-    await mark_delivered(db_session, reminder.id)
-    await db_session.refresh(reminder)
+    reminder = await mark_delivered(db_session, reminder.id)
     assert reminder.is_delivered is True
 
 
@@ -406,25 +461,23 @@ async def test_recurring_reminder_stops_at_end_date(sample_family, db_session):
 async def test_recurring_reminder_not_in_due_after_reschedule(sample_family, db_session):
     """반복 리마인더가 재설정된 후에는 현재 시점의 due 목록에 나타나지 않는다."""
     admin = sample_family["admin"]
-    now = datetime(2026, 3, 1, 12, 0)
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "반복 리마인더",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="daily",
     )
 
     # 발송 전: due 목록에 있어야 함
-    due = await get_due_reminders(db_session, now)
+    due = await get_due_reminders(db_session, NOW)
     assert len(due) == 1
 
     # 발송 후: 다음 날로 재설정되어 현재 시점 due 목록에서 사라짐
     await mark_delivered(db_session, reminder.id)
-    due = await get_due_reminders(db_session, now)
+    due = await get_due_reminders(db_session, NOW)
     assert len(due) == 0
 
     # 다음 날 시점: 다시 due 목록에 나타남
@@ -437,13 +490,12 @@ async def test_recurring_reminder_not_in_due_after_reschedule(sample_family, db_
 async def test_recurring_reminder_shows_in_active_list(sample_family, db_session):
     """반복 리마인더는 is_delivered=False 상태를 유지하므로 활성 목록에 계속 나타난다."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
 
     await set_reminder(
         db_session,
         admin.id,
         "매일 반복",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="daily",
     )
@@ -463,14 +515,13 @@ async def test_recurring_reminder_shows_in_active_list(sample_family, db_session
 async def test_set_recurring_reminder_with_all_fields(sample_family, db_session):
     """반복 리마인더 생성 시 모든 필드가 올바르게 저장되는지 확인."""
     admin = sample_family["admin"]
-    remind_at = datetime(2026, 3, 1, 9, 0)
     end_date = datetime(2026, 6, 30, 23, 59)
 
     reminder = await set_reminder(
         db_session,
         admin.id,
         "전체 필드 테스트",
-        remind_at,
+        MAR1_0900,
         is_recurring=True,
         recurrence_rule="weekly",
         recurrence_count=10,
@@ -483,3 +534,110 @@ async def test_set_recurring_reminder_with_all_fields(sample_family, db_session)
     assert reminder.recurrence_end_date == end_date
     assert reminder.delivered_count == 0
     assert reminder.is_delivered is False
+
+
+@pytest.mark.asyncio
+async def test_mark_delivered_bulk(sample_family, db_session):
+    """일괄 발송 처리: 규칙별 재설정과 종료 조건이 mark_delivered와 같게 동작한다."""
+    admin = sample_family["admin"]
+    remind_at = datetime(2026, 1, 31, 9, 0)
+
+    once = await set_reminder(db_session, admin.id, "일회성", remind_at)
+    daily = await set_reminder(
+        db_session, admin.id, "매일", remind_at, is_recurring=True, recurrence_rule="daily"
+    )
+    weekly = await set_reminder(
+        db_session, admin.id, "매주", remind_at, is_recurring=True, recurrence_rule=" Weekly "
+    )
+    monthly = await set_reminder(
+        db_session, admin.id, "매월", remind_at, is_recurring=True, recurrence_rule="monthly"
+    )
+    last = await set_reminder(
+        db_session,
+        admin.id,
+        "마지막 회차",
+        remind_at,
+        is_recurring=True,
+        recurrence_rule="daily",
+        recurrence_count=1,
+    )
+    past_end = await set_reminder(
+        db_session,
+        admin.id,
+        "종료일 초과",
+        remind_at,
+        is_recurring=True,
+        recurrence_rule="daily",
+        recurrence_end_date=datetime(2026, 1, 31, 23, 59),
+    )
+    untouched = await set_reminder(db_session, admin.id, "대상 아님", remind_at)
+
+    await mark_delivered_bulk(
+        db_session, [once.id, daily.id, weekly.id, monthly.id, last.id, past_end.id]
+    )
+
+    assert once.is_delivered is True
+    assert daily.is_delivered is False
+    assert daily.remind_at == datetime(2026, 2, 1, 9, 0)
+    assert weekly.remind_at == datetime(2026, 2, 7, 9, 0)
+    assert monthly.is_delivered is False
+    assert monthly.remind_at == datetime(2026, 2, 28, 9, 0)
+    assert last.is_delivered is True
+    assert past_end.is_delivered is True
+    assert past_end.remind_at == remind_at
+    for reminder in (once, daily, weekly, monthly, last, past_end):
+        assert reminder.delivered_count == 1
+
+    await db_session.refresh(untouched)
+    assert untouched.is_delivered is False
+    assert untouched.delivered_count == 0
+
+    due = await get_due_reminders(db_session, datetime(2026, 2, 1, 9, 0))
+    assert {r.message for r in due} == {"매일", "대상 아님"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("recurrence_rule", "recurrence_end_date"),
+    [
+        (None, None),
+        ("", None),
+        ("daily", None),
+        (" Weekly ", None),
+        ("weekly\n", None),
+        ("monthly\t", None),
+        ("yearly", None),
+        # 마이크로초까지 비교해야 종료 여부가 갈리는 경계
+        ("daily", datetime(2026, 2, 1, 9, 0, 0, 500)),
+    ],
+)
+async def test_mark_delivered_bulk_matches_mark_delivered(
+    sample_family, db_session, recurrence_rule, recurrence_end_date
+):
+    """같은 리마인더에 대해 mark_delivered와 mark_delivered_bulk의 결과가 같다."""
+    admin = sample_family["admin"]
+    remind_at = datetime(2026, 1, 31, 9, 0, 0, 750)
+
+    single, bulk = [
+        await set_reminder(
+            db_session,
+            admin.id,
+            message,
+            remind_at,
+            is_recurring=True,
+            recurrence_rule=recurrence_rule,
+            recurrence_end_date=recurrence_end_date,
+        )
+        for message in ("단건", "일괄")
+    ]
+
+    await mark_delivered(db_session, single.id)
+    await mark_delivered_bulk(db_session, [bulk.id])
+    await db_session.refresh(single)
+    await db_session.refresh(bulk)
+
+    assert (bulk.is_delivered, bulk.remind_at, bulk.delivered_count) == (
+        single.is_delivered,
+        single.remind_at,
+        single.delivered_count,
+    )
@@ -25,29 +25,27 @@ async def test_get_recent_conversations_returns_messages(sample_family, db_sessi
     """저장된 대화 이력을 시간순으로 반환한다."""
     admin = sample_family["admin"]
 
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="user",
-            content="안녕하세요",
-            platform="telegram",
-        )
-    )
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="assistant",
-            content="안녕하세요! 무엇을 도와드릴까요?",
-            platform="telegram",
-        )
-    )
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="user",
-            content="오늘 일정 알려줘",
-            platform="telegram",
-        )
+    db_session.add_all(
+        [
+            ConversationHistory(
+                user_id=admin.id,
+                role="user",
+                content="안녕하세요",
+                platform="telegram",
+            ),
+            ConversationHistory(
+                user_id=admin.id,
+                role="assistant",
+                content="안녕하세요! 무엇을 도와드릴까요?",
+                platform="telegram",
+            ),
+            ConversationHistory(
+                user_id=admin.id,
+                role="user",
+                content="오늘 일정 알려줘",
+                platform="telegram",
+            ),
+        ]
     )
     await db_session.commit()
 
@@ -64,15 +62,17 @@ async def test_get_recent_conversations_respects_max_messages(sample_family, db_
     """max_messages 제한을 초과하면 최신 N개만 반환한다."""
     admin = sample_family["admin"]
 
-    for i in range(10):
-        db_session.add(
+    db_session.add_all(
+        [
             ConversationHistory(
                 user_id=admin.id,
                 role="user",
                 content=f"메시지 {i}",
                 platform="telegram",
             )
-        )
+            for i in range(10)
+        ]
+    )
     await db_session.commit()
 
     messages = await get_recent_conversations(db_session, admin.id, max_messages=3)
@@ -96,17 +96,15 @@ async def test_get_recent_conversations_respects_ttl(sample_family, db_session):
         platform="telegram",
     )
     old_msg.created_at = datetime.now(timezone.utc) - timedelta(hours=25)
-    db_session.add(old_msg)
 
     # 최근 메시지
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="user",
-            content="최근 메시지",
-            platform="telegram",
-        )
+    recent_msg = ConversationHistory(
+        user_id=admin.id,
+        role="user",
+        content="최근 메시지",
+        platform="telegram",
     )
+    db_session.add_all([old_msg, recent_msg])
     await db_session.commit()
 
     messages = await get_recent_conversations(db_session, admin.id, ttl_hours=24)
@@ -120,21 +118,21 @@ async def test_get_recent_conversations_filters_by_user(sample_family, db_sessio
     admin = sample_family["admin"]
     member = sample_family["member"]
 
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="user",
-            content="아빠 메시지",
-            platform="telegram",
-        )
-    )
-    db_session.add(
-        ConversationHistory(
-            user_id=member.id,
-            role="user",
-            content="엄마 메시지",
-            platform="telegram",
-        )
+    db_session.add_all(
+        [
+            ConversationHistory(
+                user_id=admin.id,
+                role="user",
+                content="아빠 메시지",
+                platform="telegram",
+            ),
+            ConversationHistory(
+                user_id=member.id,
+                role="user",
+                content="엄마 메시지",
+                platform="telegram",
+            ),
+        ]
     )
     await db_session.commit()
 
@@ -213,17 +211,15 @@ async def test_cleanup_old_conversations_deletes_old_records(sample_family, db_s
         platform="telegram",
     )
     old_msg.created_at = datetime.now(timezone.utc) - timedelta(days=31)
-    db_session.add(old_msg)
 
     # 최근 메시지
-    db_session.add(
-        ConversationHistory(
-            user_id=admin.id,
-            role="user",
-            content="최근 메시지",
-            platform="telegram",
-        )
+    recent_msg = ConversationHistory(
+        user_id=admin.id,
+        role="user",
+        content="최근 메시지",
+        platform="telegram",
     )
+    db_session.add_all([old_msg, recent_msg])
     await db_session.commit()
 
     deleted = await cleanup_old_conversations(db_session, retention_days=30)
@@ -274,7 +270,6 @@ async def test_cleanup_old_conversations_respects_retention_days(sample_family,
         platform="telegram",
     )
     msg_10d.created_at = datetime.now(timezone.utc) - timedelta(days=10)
-    db_session.add(msg_10d)
 
     # 20일 전 메시지
     msg_20d = ConversationHistory(
@@ -284,8 +279,8 @@ async def test_cleanup_old_conversations_respects_retention_days(sample_family,
         platform="telegram",
     )
     msg_20d.created_at = datetime.now(timezone.utc) - timedelta(days=20)
-    db_session.add(msg_20d)
 
+    db_session.add_all([msg_10d, msg_20d])
     await db_session.commit()
 
     # 보관 기간 15일: 20일 전 메시지만 삭제
@@ -304,16 +299,19 @@ async def test_cleanup_old_conversations_deletes_all_users(sample_family, db_ses
     member = sample_family["member"]
 
     # 두 사용자의 오래된 메시지
-    for user in [admin, member]:
-        old_msg = ConversationHistory(
-            user_id=user.id,
-            role="user",
-            content=f"{user.display_name}의 오래된 메시지",
-            platform="telegram",
-        )
-        old_msg.created_at = datetime.now(timezone.utc) - timedelta(days=31)
-        db_session.add(old_msg)
-
+    old_at = datetime.now(timezone.utc) - timedelta(days=31)
+    db_session.add_all(
+        [
+            ConversationHistory(
+                user_id=user.id,
+                role="user",
+                content=f"{user.display_name}의 오래된 메시지",
+                platform="telegram",
+                created_at=old_at,
+            )
+            for user in [admin, member]
+        ]
+    )
     await db_session.commit()
 
     deleted = await cleanup_old_conversations(db_session, retention_days=30)
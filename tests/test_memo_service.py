@@ -8,7 +8,9 @@ from secretary.services.memo_service import (
     delete_memo,
     delete_todo,
     list_memos,
+    list_memos_summary,
     list_todos,
+    list_todos_summary,
     search_memos,
     toggle_todo,
     update_memo,
@@ -48,6 +50,23 @@ async def test_memo_family_visibility(sample_family, db_session):
     assert member_memos[0].title == "가족 공유 메모"
 
 
+@pytest.mark.asyncio
+async def test_list_memos_summary(sample_family, db_session):
+    """요약 조회는 list_memos와 같은 가시성 규칙으로 필요한 컬럼만 반환한다."""
+    admin = sample_family["admin"]
+    member = sample_family["member"]
+    group = sample_family["group"]
+
+    memo = await create_memo(db_session, admin.id, "가족 공유 메모", visibility="family")
+    await create_memo(db_session, admin.id, "비공개 메모", visibility="private")
+
+    rows = await list_memos_summary(db_session, member.id, group.id)
+    assert len(rows) == 1
+    assert rows[0].id == memo.id
+    assert rows[0].title == "가족 공유 메모"
+    assert rows[0].visibility == "family"
+
+
 @pytest.mark.asyncio
 async def test_search_memos(sample_family, db_session):
     admin = sample_family["admin"]
@@ -129,6 +148,8 @@ async def test_toggle_todo(sample_family, db_session):
 
     toggled = await toggle_todo(db_session, todo.id, admin.id)
     assert toggled.is_done is True
+    # 세션에 로드된 인스턴스도 refresh 없이 갱신된다
+    assert toggled is todo
 
     toggled2 = await toggle_todo(db_session, todo.id, admin.id)
     assert toggled2.is_done is False
@@ -173,6 +194,29 @@ async def test_todo_family_visibility(sample_family, db_session):
     assert member_todos[0].title == "가족 할일"
 
 
+@pytest.mark.asyncio
+async def test_list_todos_summary(sample_family, db_session):
+    """요약 조회는 list_todos와 같은 완료/가시성 조건으로 필요한 컬럼만 반환한다."""
+    admin = sample_family["admin"]
+    member = sample_family["member"]
+    group = sample_family["group"]
+
+    todo = await create_todo(db_session, admin.id, "가족 할일", visibility="family", priority=2)
+    done = await create_todo(db_session, admin.id, "완료된 할일", visibility="family")
+    await toggle_todo(db_session, done.id, admin.id)
+
+    rows = await list_todos_summary(db_session, member.id, group.id)
+    assert len(rows) == 1
+    assert rows[0].id == todo.id
+    assert rows[0].title == "가족 할일"
+    assert rows[0].is_done is False
+    assert rows[0].priority == 2
+    assert rows[0].due_date is None
+
+    rows_all = await list_todos_summary(db_session, member.id, group.id, include_done=True)
+    assert len(rows_all) == 2
+
+
 @pytest.mark.asyncio
 async def test_update_todo(sample_family, db_session):
     admin = sample_family["admin"]
@@ -0,0 +1,122 @@
+"""Tests for ReminderEngine: 리마인더 전송/발송 완료 처리."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from secretary.scheduler import reminder_engine as engine_module
+from secretary.scheduler.reminder_engine import ReminderEngine
+from secretary.services.calendar_service import set_reminder
+from secretary.services.notification_service import notification_service
+
+NOW = datetime.now()
+
+
+@pytest.fixture
+def engine(db_session):
+    """테스트 세션을 사용하는 ReminderEngine (스케줄러는 시작하지 않는다)."""
+
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    with patch.object(engine_module, "async_session", _session):
+        yield ReminderEngine()
+
+
+@pytest.mark.asyncio
+async def test_sent_reminders_marked_when_later_send_raises(sample_family, db_session, engine):
+    """전송 도중 예외가 나도 이미 보낸 리마인더는 발송 완료로 기록된다."""
+    admin = sample_family["admin"]
+    first = await set_reminder(db_session, admin.id, "먼저", NOW - timedelta(hours=2))
+    second = await set_reminder(db_session, admin.id, "나중", NOW - timedelta(hours=1))
+
+    notify = AsyncMock(side_effect=[True, RuntimeError("DB error")])
+    with patch.object(notification_service, "notify_user", notify):
+        await engine._check_reminders()
+
+    assert first.is_delivered is True
+    assert second.is_delivered is False
+
+
+@pytest.mark.asyncio
+async def test_failing_reminders_do_not_starve_newer(sample_family, db_session, engine):
+    """배치 크기보다 많은 리마인더가 계속 실패해도 더 최근 리마인더는 전송된다."""
+    admin = sample_family["admin"]
+    for i in range(3):
+        await set_reminder(db_session, admin.id, f"실패 {i}", NOW - timedelta(hours=3, minutes=i))
+    newer = await set_reminder(db_session, admin.id, "최근", NOW - timedelta(minutes=1))
+
+    async def _notify(session, user_id, message):
+        return "최근" in message
+
+    with (
+        patch.object(engine_module.settings, "reminder_batch_size", 2),
+        patch.object(notification_service, "notify_user", AsyncMock(side_effect=_notify)),
+    ):
+        # 첫 폴링은 실패하는 리마인더 2개로 가득 차고, 다음 폴링은 그 뒤부터 조회한다
+        assert await engine._check_reminders() == 0
+        assert newer.is_delivered is False
+        assert await engine._check_reminders() == 1
+        assert newer.is_delivered is True
+
+        # 커서 뒤에 남은 리마인더가 없으면 커서를 지워 다음 폴링은 처음부터 조회한다
+        assert await engine._check_reminders() == 0
+    assert engine._cursor is None
+
+
+class _FakeScheduler:
+    """reschedule_job() 호출 간격만 기록하는 스케줄러."""
+
+    def __init__(self) -> None:
+        self.intervals: list[float] = []
+
+    def reschedule_job(self, job_id, trigger) -> None:
+        self.intervals.append(trigger.interval.total_seconds())
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_backs_off_on_delivered_count():
+    """전송한 리마인더가 없으면(실패만 있어도) 간격을 늘리고, 전송하면 최소 간격으로 돌아간다."""
+    engine = ReminderEngine()
+    scheduler = _FakeScheduler()
+    engine._scheduler = scheduler
+
+    # 0 = 전송 성공 없음 (due 리마인더가 모두 실패한 경우 포함)
+    check = AsyncMock(side_effect=[0, 0, 0, 0, 0, 2, 0])
+    with patch.object(engine, "_check_reminders", check):
+        for _ in range(7):
+            await engine._poll_reminders()
+
+    # 시작 간격 5초 → 10 → 20 → 30 → (30 유지) → (30 유지) → 5 → 10
+    assert scheduler.intervals == [10.0, 20.0, 30.0, 5.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_check_reminders_returns_delivered_count(sample_family, db_session, engine):
+    """전송에 실패한 리마인더는 반환값(백오프 기준)에 포함되지 않는다."""
+    admin = sample_family["admin"]
+    await set_reminder(db_session, admin.id, "실패", NOW - timedelta(hours=1))
+
+    with patch.object(notification_service, "notify_user", AsyncMock(return_value=False)):
+        assert await engine._check_reminders() == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_stays_minimal_while_batches_remain():
+    """전송 성공이 없어도 남은 배치가 있으면(커서 설정) 최소 간격을 유지한다."""
+    engine = ReminderEngine()
+    scheduler = _FakeScheduler()
+    engine._scheduler = scheduler
+
+    async def _full_batch_of_failures() -> int:
+        engine._cursor = (NOW, 1)
+        return 0
+
+    with patch.object(engine, "_check_reminders", _full_batch_of_failures):
+        await engine._poll_reminders()
+
+    assert scheduler.intervals == []
+    assert engine._poll_interval == 5.0
@@ -1,19 +1,24 @@
 """Tests for user_service: registration, family group creation, platform linking, invites."""
 
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from sqlalchemy import func, insert, select
 
-from secretary.models.user import FamilyGroup
+from secretary.models.user import FamilyGroup, FamilyInvite, User, UserPlatformLink
+from secretary.services import user_service
 from secretary.services.user_service import (
     create_family_invite,
     deactivate_invite,
     get_family_members,
+    get_family_members_by_group,
     get_or_create_user,
     get_user_by_platform,
     get_user_platform_links,
     link_platform,
     list_family_invites,
+    use_invite_code,
     validate_invite_code,
 )
 
@@ -38,9 +43,9 @@ async def test_first_user_becomes_admin(db_session):
 
 
 @pytest.mark.asyncio
-async def test_second_user_becomes_member_with_invite(db_session):
+async def test_second_user_becomes_member_with_invite(sample_admin, db_session):
     """Second user should join existing family group as member via invite code."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -53,9 +58,9 @@ async def test_second_user_becomes_member_with_invite(db_session):
 
 
 @pytest.mark.asyncio
-async def test_no_invite_creates_new_group(db_session):
+async def test_no_invite_creates_new_group(sample_admin, db_session):
     """User without invite code should create their own family group."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     user2 = await get_or_create_user(db_session, "telegram", "tg_002", "이웃")
 
     assert user2.role == "admin"
@@ -63,19 +68,17 @@ async def test_no_invite_creates_new_group(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_or_create_returns_existing(db_session):
+async def test_get_or_create_returns_existing(sample_admin, db_session):
     """Calling with same platform_user_id should return existing user, not create new."""
-    user1 = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    user1 = sample_admin
     user2 = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
 
     assert user1.id == user2.id
 
 
 @pytest.mark.asyncio
-async def test_get_user_by_platform(db_session):
+async def test_get_user_by_platform(sample_admin, db_session):
     """Look up user by platform credentials."""
-    await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
-
     found = await get_user_by_platform(db_session, "telegram", "tg_001")
     assert found is not None
     assert found.display_name == "아빠"
@@ -95,6 +98,16 @@ async def test_get_family_members(sample_family, db_session):
     assert names == {"아빠", "엄마"}
 
 
+@pytest.mark.asyncio
+async def test_get_family_members_by_group(sample_family, db_session):
+    """Should return all members of the given family group."""
+    group = sample_family["group"]
+    members = await get_family_members_by_group(db_session, group.id)
+
+    assert {m.display_name for m in members} == {"아빠", "엄마"}
+    assert await get_family_members_by_group(db_session, 9999) == []
+
+
 @pytest.mark.asyncio
 async def test_get_family_members_invalid_user(db_session):
     """Should return empty list for non-existent user."""
@@ -121,9 +134,9 @@ async def test_link_platform(sample_family, db_session):
 
 
 @pytest.mark.asyncio
-async def test_create_family_invite_admin_only(db_session):
+async def test_create_family_invite_admin_only(sample_admin, db_session):
     """Only admin can create invites."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
     assert len(invite.code) == 8
@@ -141,9 +154,9 @@ async def test_create_family_invite_admin_only(db_session):
 
 
 @pytest.mark.asyncio
-async def test_validate_invite_code(db_session):
+async def test_validate_invite_code(sample_admin, db_session):
     """Valid code should pass, invalid/expired/exhausted should fail."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -162,9 +175,9 @@ async def test_validate_invite_code(db_session):
 
 
 @pytest.mark.asyncio
-async def test_invite_code_joins_family(db_session):
+async def test_invite_code_joins_family(sample_admin, db_session):
     """User with valid invite code should join the inviter's family."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -175,15 +188,83 @@ async def test_invite_code_joins_family(db_session):
     assert new_user.family_group_id == admin.family_group_id
     assert new_user.role == "member"
 
-    # Invite use_count should be incremented
-    await db_session.refresh(invite)
+    # Invite use_count should be incremented (no refresh needed)
     assert invite.use_count == 1
 
 
+async def _insert_rival_registration(session, platform_user_id: str) -> None:
+    """같은 플랫폼 계정을 동시에 등록한 경쟁 요청의 행(그룹/사용자/링크)을 넣는다."""
+    with session.no_autoflush:
+        group_id = (
+            await session.execute(insert(FamilyGroup).values(name="경쟁").returning(FamilyGroup.id))
+        ).scalar_one()
+        user_id = (
+            await session.execute(
+                insert(User)
+                .values(display_name="경쟁자", family_group_id=group_id, role="admin")
+                .returning(User.id)
+            )
+        ).scalar_one()
+        await session.execute(
+            insert(UserPlatformLink).values(
+                user_id=user_id, platform="telegram", platform_user_id=platform_user_id
+            )
+        )
+
+
 @pytest.mark.asyncio
-async def test_expired_invite_code(db_session):
+@pytest.mark.parametrize("with_invite", [False, True])
+async def test_get_or_create_user_lost_race(sample_admin, db_session, with_invite):
+    """링크 INSERT가 UNIQUE 위반이면 롤백 후 먼저 등록된 사용자를 반환한다.
+
+    우리 쪽 그룹/사용자와 초대 코드 사용 횟수는 남지 않아야 한다.
+    """
+    invite = await create_family_invite(db_session, sample_admin.id) if with_invite else None
+    invite_code = invite.code if invite else None
+    groups_before = await db_session.scalar(select(func.count(FamilyGroup.id)))
+    users_before = await db_session.scalar(select(func.count(User.id)))
+
+    real_commit = db_session.commit
+    real_rollback = db_session.rollback
+
+    async def _commit():
+        # 우리 링크가 flush되기 직전에 경쟁 요청이 같은 계정을 먼저 등록한다
+        await _insert_rival_registration(db_session, "tg_race")
+        await real_commit()
+
+    async def _rollback():
+        # 테스트는 한 연결의 SAVEPOINT 안에서 돌기 때문에 롤백이 경쟁 요청의 행까지 지운다.
+        # 실제로는 다른 트랜잭션에서 이미 커밋된 행이므로 롤백 후 다시 넣어 준다.
+        await real_rollback()
+        await _insert_rival_registration(db_session, "tg_race")
+
+    with (
+        patch.object(db_session, "commit", _commit),
+        patch.object(db_session, "rollback", _rollback),
+    ):
+        user = await get_or_create_user(
+            db_session,
+            "telegram",
+            "tg_race",
+            "패자",
+            invite_code=invite_code,
+        )
+
+    assert user.display_name == "경쟁자"
+    # 경쟁 요청의 그룹/사용자 1개씩만 늘어난다 (우리 쪽 행은 롤백됨)
+    assert await db_session.scalar(select(func.count(FamilyGroup.id))) == groups_before + 1
+    assert await db_session.scalar(select(func.count(User.id))) == users_before + 1
+    if invite_code:
+        use_count = await db_session.scalar(
+            select(FamilyInvite.use_count).where(FamilyInvite.code == invite_code)
+        )
+        assert use_count == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_invite_code(sample_admin, db_session):
     """Expired invite code should be rejected."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -203,9 +284,9 @@ async def test_expired_invite_code(db_session):
 
 
 @pytest.mark.asyncio
-async def test_max_uses_invite(db_session):
+async def test_max_uses_invite(sample_admin, db_session):
     """Invite with max_uses should reject after exhausted."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id, max_uses=1)
     assert invite is not None
 
@@ -221,9 +302,39 @@ async def test_max_uses_invite(db_session):
 
 
 @pytest.mark.asyncio
-async def test_deactivate_invite(db_session):
+async def test_use_invite_code_rejects_exhausted(sample_admin, db_session):
+    """검증 후 다른 요청이 마지막 사용 횟수를 가져갔으면 사용 처리되지 않는다."""
+    invite = await create_family_invite(db_session, sample_admin.id, max_uses=1)
+    assert invite is not None
+    assert await use_invite_code(db_session, invite) is True
+
+    # 검증 시점에는 유효했던 같은 초대로 한 번 더 시도
+    assert await use_invite_code(db_session, invite) is False
+    assert invite.use_count == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_invite_race_creates_new_group(sample_admin, db_session):
+    """검증과 사용 사이에 초대가 소진되면 새 가족 그룹의 admin으로 가입한다."""
+    invite = await create_family_invite(db_session, sample_admin.id, max_uses=1)
+    assert invite is not None
+    await get_or_create_user(db_session, "telegram", "tg_002", "엄마", invite_code=invite.code)
+
+    # validate_invite_code가 소진 직전의 초대를 돌려준 상황을 재현한다
+    with patch.object(user_service, "validate_invite_code", AsyncMock(return_value=invite)):
+        user = await get_or_create_user(
+            db_session, "telegram", "tg_003", "딸", invite_code=invite.code
+        )
+
+    assert user.role == "admin"
+    assert user.family_group_id != sample_admin.family_group_id
+    assert invite.use_count == 1
+
+
+@pytest.mark.asyncio
+async def test_deactivate_invite(sample_admin, db_session):
     """Creator should be able to deactivate their invite."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -237,9 +348,9 @@ async def test_deactivate_invite(db_session):
 
 
 @pytest.mark.asyncio
-async def test_deactivate_invite_wrong_user(db_session):
+async def test_deactivate_invite_wrong_user(sample_admin, db_session):
     """Non-creator should not be able to deactivate invite."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
+    admin = sample_admin
     invite = await create_family_invite(db_session, admin.id)
     assert invite is not None
 
@@ -252,11 +363,22 @@ async def test_deactivate_invite_wrong_user(db_session):
 
 
 @pytest.mark.asyncio
-async def test_list_family_invites(db_session):
+async def test_list_family_invites(sample_admin, db_session):
     """Admin should see active invites for their family."""
-    admin = await get_or_create_user(db_session, "telegram", "tg_001", "아빠")
-    await create_family_invite(db_session, admin.id)
-    await create_family_invite(db_session, admin.id)
+    admin = sample_admin
+    expires_at = datetime.now() + timedelta(days=7)
+    db_session.add_all(
+        [
+            FamilyInvite(
+                family_group_id=admin.family_group_id,
+                code=code,
+                created_by=admin.id,
+                expires_at=expires_at,
+            )
+            for code in ("INVITE01", "INVITE02")
+        ]
+    )
+    await db_session.commit()
 
     invites = await list_family_invites(db_session, admin.id)
     assert len(invites) == 2